@@ -1,41 +1,62 @@
 #!/usr/bin/env python3
 """
 Explore challenges field to understand available metrics
+
+Usage: python sample_data/analyze_challenges_field.py [match.json ...]
 """
-import json
-
-with open('sample_data/match.json', 'r') as f:
-    data = json.load(f)
-
-participant = data['info']['participants'][0]
-challenges = participant.get('challenges', {})
-
-print("="*80)
-print("CHALLENGES FIELD - Available Metrics")
-print("="*80)
-print(f"\nTotal challenge metrics: {len(challenges)}")
-print("\nChallenge keys (first 50):")
-for i, key in enumerate(list(challenges.keys())[:50], 1):
-    value = challenges[key]
-    print(f"{i:2}. {key:50} = {value}")
-
-print("\n\nRELEVANT METRICS BY CATEGORY:")
-print("\n1. ECONOMY/TEMPO:")
-economy_keys = [k for k in challenges.keys() if any(word in k.lower() for word in ['gold', 'damage', 'cs', 'farm', 'tempo', 'advantage'])]
-for key in economy_keys[:15]:
-    print(f"  {key}: {challenges[key]}")
-
-print("\n2. OBJECTIVES/MACRO:")
-objective_keys = [k for k in challenges.keys() if any(word in k.lower() for word in ['objective', 'dragon', 'baron', 'tower', 'turret', 'inhibitor', 'takedown', 'level', 'solo'])]
-for key in objective_keys[:15]:
-    print(f"  {key}: {challenges[key]}")
-
-print("\n3. MAP CONTROL/VISION:")
-vision_keys = [k for k in challenges.keys() if any(word in k.lower() for word in ['vision', 'ward', 'control', 'sweep', 'stealth'])]
-for key in vision_keys[:15]:
-    print(f"  {key}: {challenges[key]}")
-
-print("\n4. ERROR RATE/DEATHS:")
-error_keys = [k for k in challenges.keys() if any(word in k.lower() for word in ['death', 'died', 'kill', 'survive', 'escape', 'save'])]
-for key in error_keys[:15]:
-    print(f"  {key}: {challenges[key]}")
+import re
+import sys
+from itertools import islice
+
+from json_loader import load_cached, map_files
+
+# Keyword alternations per category, matched case-insensitively against challenge keys
+CATEGORY_PATTERNS = {
+    'ECONOMY/TEMPO': re.compile('gold|damage|cs|farm|tempo|advantage', re.I),
+    'OBJECTIVES/MACRO': re.compile('objective|dragon|baron|tower|turret|inhibitor|takedown|level|solo', re.I),
+    'MAP CONTROL/VISION': re.compile('vision|ward|control|sweep|stealth', re.I),
+    'ERROR RATE/DEATHS': re.compile('death|died|kill|survive|escape|save', re.I),
+}
+MAX_PER_CATEGORY = 15
+
+def analyze_challenges(filepath):
+    """Report the challenge metrics of the first participant in a match file"""
+    data = load_cached(filepath)
+
+    participant = data['info']['participants'][0]
+    challenges = participant.get('challenges', {})
+
+    # Collect output lines and return them as one report
+    out = []
+
+    out.append("="*80)
+    out.append("CHALLENGES FIELD - Available Metrics")
+    out.append("="*80)
+    out.append(f"\nTotal challenge metrics: {len(challenges)}")
+    out.append("\nChallenge keys (first 50):")
+    for i, (key, value) in enumerate(islice(challenges.items(), 50), 1):
+        out.append(f"{i:2}. {key:50} = {value}")
+
+    out.append("\n\nRELEVANT METRICS BY CATEGORY:")
+    buckets = {name: [] for name in CATEGORY_PATTERNS}
+    full = 0
+    for key, value in challenges.items():
+        for name, pattern in CATEGORY_PATTERNS.items():
+            matches = buckets[name]
+            if len(matches) < MAX_PER_CATEGORY and pattern.search(key):
+                matches.append((key, value))
+                full += len(matches) == MAX_PER_CATEGORY
+        # Stop scanning once every category has its quota
+        if full == len(buckets):
+            break
+
+    for i, (name, matches) in enumerate(buckets.items(), 1):
+        out.append(f"\n{i}. {name}:")
+        for key, value in matches:
+            out.append(f"  {key}: {value}")
+
+    return "\n".join(out) + "\n"
+
+if __name__ == '__main__':
+    for report in map_files(analyze_challenges, sys.argv[1:] or ['sample_data/match.json']):
+        sys.stdout.write(report)
@@ -1,128 +1,210 @@
 #!/usr/bin/env python3
 """
 Extract key fields from match data for schema design
-"""
-import json
 
-def analyze_match_detail():
+Usage: python sample_data/explore_detailed_schema.py [match.json | timeline.json ...]
+"""
+import sys
+from array import array
+from itertools import islice
+
+from json_loader import extract_paths, is_timeline, load_cached, map_files
+
+# Game-level info fields printed for the schema
+GAME_INFO_FIELDS = (
+    'gameId', 'platformId', 'gameMode', 'gameType', 'gameDuration',
+    'gameStartTimestamp', 'gameEndTimestamp', 'queueId', 'mapId', 'gameVersion'
+)
+
+# Integer participant stats gathered for every player
+STAT_FIELDS = (
+    'kills', 'deaths', 'assists', 'goldEarned', 'totalDamageDealtToChampions',
+    'visionScore', 'champLevel'
+)
+
+# Subset of match.json read by analyze_match_detail (path -> max values kept)
+MATCH_PATHS = {
+    'metadata': 1,
+    **{f'info.{field}': 1 for field in GAME_INFO_FIELDS},
+    'info.teams.item': 2,  # Blue and red side
+    'info.participants.item': 1,  # Only the first player is printed in full
+    # Stats cover every player (the count varies by queue), so these stay
+    # uncapped and a streaming pass reads through all participants anyway
+    **{f'info.participants.item.{stat}': None for stat in STAT_FIELDS},
+}
+
+# Participant fields printed for the schema, in display order
+IMPORTANT_FIELDS = (
+    'puuid', 'summonerId', 'summonerName', 'riotIdGameName', 'riotIdTagline',
+    'championId', 'championName', 'teamId', 'teamPosition', 'individualPosition',
+    'kills', 'deaths', 'assists', 'goldEarned', 'totalDamageDealtToChampions',
+    'visionScore', 'champLevel', 'win',
+    'item0', 'item1', 'item2', 'item3', 'item4', 'item5', 'item6',
+    'summoner1Id', 'summoner2Id'
+)
+IMPORTANT_FIELD_SET = frozenset(IMPORTANT_FIELDS)
+
+def participant_stat_columns(fields):
+    """Pack STAT_FIELDS into one int32 column per stat across all participants
+
+    Columns are NumPy arrays when NumPy is installed so reductions run in C,
+    and stdlib array('i') columns otherwise. NumPy is imported here rather
+    than at module level so loading the script does not pay for it.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    columns = {}
+    for stat in STAT_FIELDS:
+        values = fields[f'info.participants.item.{stat}']
+        if np is not None:
+            columns[stat] = np.fromiter(values, dtype=np.int32, count=len(values))
+        else:
+            columns[stat] = array('i', values)
+    return columns
+
+def summarize_column(column):
+    """Return (total, max, index of max) for a stat column"""
+    if isinstance(column, array):
+        best = max(range(len(column)), key=column.__getitem__)
+        return sum(column), column[best], best
+    best = int(column.argmax())
+    return int(column.sum()), int(column[best]), best
+
+def analyze_match_detail(filepath):
     """Extract key fields from match.json"""
-    with open('sample_data/match.json', 'r') as f:
-        data = json.load(f)
+    out = []
+    fields = extract_paths(filepath, MATCH_PATHS)
 
-    print("="*80)
-    print("MATCH DATA - Key Fields for Schema")
-    print("="*80)
+    out.append("="*80)
+    out.append("MATCH DATA - Key Fields for Schema")
+    out.append("="*80)
 
     # Metadata
-    metadata = data['metadata']
-    print(f"\nMETADATA:")
-    print(f"  matchId: {metadata['matchId']}")
-    print(f"  participants (PUUIDs): {len(metadata['participants'])} players")
-    print(f"    Sample PUUID: {metadata['participants'][0]}")
+    metadata = fields['metadata'][0]
+    out.append(f"\nMETADATA:")
+    out.append(f"  matchId: {metadata['matchId']}")
+    out.append(f"  participants (PUUIDs): {len(metadata['participants'])} players")
+    out.append(f"    Sample PUUID: {metadata['participants'][0]}")
 
     # Info - Game level
-    info = data['info']
-    print(f"\nGAME INFO:")
-    print(f"  gameId: {info['gameId']}")
-    print(f"  platformId: {info['platformId']}")
-    print(f"  gameMode: {info['gameMode']}")
-    print(f"  gameType: {info['gameType']}")
-    print(f"  gameDuration: {info['gameDuration']}s ({info['gameDuration']//60}min)")
-    print(f"  gameStartTimestamp: {info['gameStartTimestamp']} (epoch ms)")
-    print(f"  gameEndTimestamp: {info['gameEndTimestamp']} (epoch ms)")
-    print(f"  queueId: {info['queueId']}")
-    print(f"  mapId: {info['mapId']}")
-    print(f"  gameVersion: {info['gameVersion']}")
+    info = {field: fields[f'info.{field}'][0] for field in GAME_INFO_FIELDS}
+    out.append(f"\nGAME INFO:")
+    out.append(f"  gameId: {info['gameId']}")
+    out.append(f"  platformId: {info['platformId']}")
+    out.append(f"  gameMode: {info['gameMode']}")
+    out.append(f"  gameType: {info['gameType']}")
+    out.append(f"  gameDuration: {info['gameDuration']}s ({info['gameDuration']//60}min)")
+    out.append(f"  gameStartTimestamp: {info['gameStartTimestamp']} (epoch ms)")
+    out.append(f"  gameEndTimestamp: {info['gameEndTimestamp']} (epoch ms)")
+    out.append(f"  queueId: {info['queueId']}")
+    out.append(f"  mapId: {info['mapId']}")
+    out.append(f"  gameVersion: {info['gameVersion']}")
 
     # Teams
-    print(f"\nTEAMS:")
-    for team in info['teams']:
-        print(f"  Team {team['teamId']}:")
-        print(f"    win: {team['win']}")
-        print(f"    objectives: {list(team['objectives'].keys())}")
+    out.append(f"\nTEAMS:")
+    for team in fields['info.teams.item']:
+        out.append(f"  Team {team['teamId']}:")
+        out.append(f"    win: {team['win']}")
+        out.append(f"    objectives: {list(team['objectives'].keys())}")
         if 'bans' in team:
-            print(f"    bans: {len(team['bans'])} champions")
+            out.append(f"    bans: {len(team['bans'])} champions")
 
     # Participants - Sample first player
-    print(f"\nPARTICIPANT FIELDS (First Player):")
-    participant = info['participants'][0]
-    important_fields = [
-        'puuid', 'summonerId', 'summonerName', 'riotIdGameName', 'riotIdTagline',
-        'championId', 'championName', 'teamId', 'teamPosition', 'individualPosition',
-        'kills', 'deaths', 'assists', 'goldEarned', 'totalDamageDealtToChampions',
-        'visionScore', 'champLevel', 'win',
-        'item0', 'item1', 'item2', 'item3', 'item4', 'item5', 'item6',
-        'summoner1Id', 'summoner2Id'
-    ]
-    for field in important_fields:
-        if field in participant:
-            print(f"  {field}: {participant[field]}")
+    out.append(f"\nPARTICIPANT FIELDS (First Player):")
+    participant = fields['info.participants.item'][0]
+    present = participant.keys() & IMPORTANT_FIELD_SET
+    for field in IMPORTANT_FIELDS:
+        if field in present:
+            out.append(f"  {field}: {participant[field]}")
 
     # Check if challenges exists
     if 'challenges' in participant:
-        print(f"\n  challenges (sample keys): {list(participant['challenges'].keys())[:10]}")
+        out.append(f"\n  challenges (sample keys): {list(islice(participant['challenges'], 10))}")
 
     # Check perks structure
     if 'perks' in participant:
         perks = participant['perks']
-        print(f"\n  perks structure:")
-        print(f"    statPerks: {perks.get('statPerks', {})}")
+        out.append(f"\n  perks structure:")
+        out.append(f"    statPerks: {perks.get('statPerks', {})}")
         if 'styles' in perks:
-            print(f"    styles: {len(perks['styles'])} style groups")
+            out.append(f"    styles: {len(perks['styles'])} style groups")
             for style in perks['styles']:
-                print(f"      - {style['description']}: style={style['style']}")
+                out.append(f"      - {style['description']}: style={style['style']}")
+
+    # Participants - Stats across all players
+    out.append(f"\nPARTICIPANT STATS (All Players):")
+    for stat, column in participant_stat_columns(fields).items():
+        total, most, best = summarize_column(column)
+        out.append(f"  {stat}: total={total}, max={most} (participant {best + 1})")
 
-def analyze_timeline_detail():
+    return "\n".join(out) + "\n"
+
+def analyze_timeline_detail(filepath):
     """Extract key fields from MatchTimeline.json"""
-    with open('sample_data/MatchTimeline.json', 'r') as f:
-        data = json.load(f)
+    out = []
+    data = load_cached(filepath)
 
-    print("\n" + "="*80)
-    print("TIMELINE DATA - Key Fields for Schema")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("TIMELINE DATA - Key Fields for Schema")
+    out.append("="*80)
 
     info = data['info']
-    print(f"\nTIMELINE INFO:")
-    print(f"  frameInterval: {info['frameInterval']}ms")
-    print(f"  Total frames: {len(info['frames'])}")
+    out.append(f"\nTIMELINE INFO:")
+    out.append(f"  frameInterval: {info['frameInterval']}ms")
+    out.append(f"  Total frames: {len(info['frames'])}")
 
     # Participants mapping
-    print(f"\nPARTICIPANTS MAPPING:")
+    out.append(f"\nPARTICIPANTS MAPPING:")
     for participant in info['participants'][:3]:  # First 3
-        print(f"  participantId {participant['participantId']}: {participant['puuid']}")
+        out.append(f"  participantId {participant['participantId']}: {participant['puuid']}")
 
     # Frame structure
-    print(f"\nFRAME STRUCTURE (Frame 5):")
+    out.append(f"\nFRAME STRUCTURE (Frame 5):")
     frame = info['frames'][5]
-    print(f"  timestamp: {frame['timestamp']}ms")
-    print(f"  events: {len(frame['events'])} events")
+    out.append(f"  timestamp: {frame['timestamp']}ms")
+    out.append(f"  events: {len(frame['events'])} events")
 
     # Sample participant frame data
-    print(f"\nPARTICIPANT FRAME DATA (Participant 1, Frame 5):")
+    out.append(f"\nPARTICIPANT FRAME DATA (Participant 1, Frame 5):")
     pf = frame['participantFrames']['1']
-    print(f"  championStats:")
+    out.append(f"  championStats:")
     for key, value in pf['championStats'].items():
-        print(f"    {key}: {value}")
-    print(f"  currentGold: {pf['currentGold']}")
-    print(f"  goldPerSecond: {pf['goldPerSecond']}")
-    print(f"  level: {pf['level']}")
-    print(f"  position: {pf['position']}")
-    print(f"  totalGold: {pf['totalGold']}")
-    print(f"  xp: {pf['xp']}")
+        out.append(f"    {key}: {value}")
+    out.append(f"  currentGold: {pf['currentGold']}")
+    out.append(f"  goldPerSecond: {pf['goldPerSecond']}")
+    out.append(f"  level: {pf['level']}")
+    out.append(f"  position: {pf['position']}")
+    out.append(f"  totalGold: {pf['totalGold']}")
+    out.append(f"  xp: {pf['xp']}")
 
     # Sample events
-    print(f"\nSAMPLE EVENTS (Frame 10):")
+    out.append(f"\nSAMPLE EVENTS (Frame 10):")
     frame10 = info['frames'][10]
     for event in frame10['events'][:5]:
-        print(f"  {event['type']} @ {event['timestamp']}ms")
+        out.append(f"  {event['type']} @ {event['timestamp']}ms")
         if event['type'] == 'CHAMPION_KILL':
-            print(f"    killerId: {event.get('killerId')}, victimId: {event.get('victimId')}")
-            print(f"    assistingParticipantIds: {event.get('assistingParticipantIds', [])}")
-            print(f"    position: {event.get('position')}")
+            out.append(f"    killerId: {event.get('killerId')}, victimId: {event.get('victimId')}")
+            out.append(f"    assistingParticipantIds: {event.get('assistingParticipantIds', [])}")
+            out.append(f"    position: {event.get('position')}")
         elif event['type'] == 'BUILDING_KILL':
-            print(f"    buildingType: {event.get('buildingType')}, teamId: {event.get('teamId')}")
-            print(f"    killerIds: {event.get('killerId')}")
+            out.append(f"    buildingType: {event.get('buildingType')}, teamId: {event.get('teamId')}")
+            out.append(f"    killerIds: {event.get('killerId')}")
+
+    return "\n".join(out) + "\n"
+
+def analyze_file(filepath):
+    """Extract key fields from a match or timeline file, telling them apart by content"""
+    if is_timeline(load_cached(filepath)):
+        return analyze_timeline_detail(filepath)
+    return analyze_match_detail(filepath)
 
 if __name__ == '__main__':
-    analyze_match_detail()
-    analyze_timeline_detail()
+    if len(sys.argv) > 1:
+        reports = map_files(analyze_file, sys.argv[1:])
+    else:
+        reports = [analyze_match_detail('sample_data/match.json'), analyze_timeline_detail('sample_data/MatchTimeline.json')]
+    for report in reports:
+        sys.stdout.write(report)
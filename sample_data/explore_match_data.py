@@ -1,118 +1,194 @@
 #!/usr/bin/env python3
 """
 Explore structure of Riot match data without loading everything into memory
+
+Usage: python sample_data/explore_match_data.py [match.json | timeline.json ...]
 """
 import json
 import sys
-from typing import Any, Dict, List
+from collections import Counter
+from itertools import islice, repeat
+from typing import Any, Dict, List, Optional
+
+from json_loader import MAPPING_TYPES, SEQUENCE_TYPES, STREAMING, is_timeline, load_lazy, map_files, stream_items
+
+def _type_name(obj: Any) -> str:
+    """Report lazy simdjson containers under their plain JSON type names"""
+    if isinstance(obj, MAPPING_TYPES):
+        return 'dict'
+    if isinstance(obj, SEQUENCE_TYPES):
+        return 'list'
+    return type(obj).__name__
+
+# Formatting per exact leaf type; numeric leaves skip the repr() and slice
+_LEAF_FORMATS = {
+    int: lambda value: f"int: {value}",
+    float: lambda value: f"float: {value}",
+    bool: lambda value: f"bool: {value}",
+    str: lambda value: f"str: {repr(value)[:50]}",
+    type(None): lambda value: "NoneType: None",
+}
+
+def _format_leaf(value: Any) -> str:
+    """Format a leaf of a type missing from _LEAF_FORMATS"""
+    return f"{type(value).__name__}: {repr(value)[:50]}"
 
 def get_structure(obj: Any, max_depth: int = 3, current_depth: int = 0, max_array_items: int = 2) -> Any:
-    """Recursively get structure of JSON object with depth limiting"""
-    if current_depth >= max_depth:
-        return f"<depth_limit_reached: {type(obj).__name__}>"
-
-    if isinstance(obj, dict):
-        result = {}
-        for key, value in obj.items():
-            result[key] = get_structure(value, max_depth, current_depth + 1, max_array_items)
-        return result
-    elif isinstance(obj, list):
-        if len(obj) == 0:
-            return []
-        # Show structure of first few items
-        samples = obj[:max_array_items]
-        result = [get_structure(item, max_depth, current_depth + 1, max_array_items) for item in samples]
-        if len(obj) > max_array_items:
-            result.append(f"<...{len(obj) - max_array_items} more items>")
-        return result
-    else:
-        # Return type and sample value for primitives
-        return f"{type(obj).__name__}: {repr(obj)[:50]}"
-
-def analyze_match_file(filepath: str):
-    """Analyze match.json structure"""
-    print(f"\n{'='*80}")
-    print(f"Analyzing: {filepath}")
-    print(f"{'='*80}\n")
-
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    """Get structure of JSON object with depth limiting
+
+    Walks an explicit stack of (node, depth, parent, slot) entries rather than
+    recursing, so each node costs a loop iteration instead of a Python call;
+    children are pushed in bulk with zip/repeat, computing depth + 1 once.
+    Works on plain dicts/lists as well as lazy simdjson roots, in which case
+    only the nodes visited within max_depth/max_array_items are decoded.
+    """
+    leaf_format = _LEAF_FORMATS.get
+    result = [None]
+    stack = [(obj, current_depth, result, 0)]
+    while stack:
+        node, depth, parent, slot = stack.pop()
+        if depth >= max_depth:
+            parent[slot] = f"<depth_limit_reached: {_type_name(node)}>"
+        elif isinstance(node, MAPPING_TYPES):
+            # Preallocate keys so slots keep document order despite LIFO filling
+            out = parent[slot] = dict.fromkeys(node)
+            stack.extend(zip(node.values(), repeat(depth + 1), repeat(out), out))
+        elif isinstance(node, SEQUENCE_TYPES):
+            # Show structure of first few items
+            samples = node[:max_array_items]
+            out = parent[slot] = [None] * len(samples)
+            stack.extend(zip(samples, repeat(depth + 1), repeat(out), range(len(samples))))
+            if len(node) > max_array_items:
+                out.append(f"<...{len(node) - max_array_items} more items>")
+        else:
+            # Return type and sample value for primitives
+            parent[slot] = leaf_format(type(node), _format_leaf)(node)
+    return result[0]
+
+def iter_event_types(filepath: str, frames: Any = None, sample_frames: Optional[int] = None):
+    """Yield timeline event types from already-loaded frames, or by streaming the file
+
+    Pass frames when the timeline is already parsed; walking them is far cheaper
+    than re-tokenizing the file. With frames=None and ijson available, only one
+    event at a time is built. sample_frames limits the scan to the first N
+    frames (None scans them all); when streaming, the file is not read past
+    the last sampled frame.
+    """
+    if frames is None:
+        if STREAMING:
+            if sample_frames is None:
+                events = stream_items(filepath, 'info.frames.item.events.item')
+                return (event.get('type', 'UNKNOWN') for event in events)
+            frame_events = islice(stream_items(filepath, 'info.frames.item.events'), sample_frames)
+            return (event.get('type', 'UNKNOWN') for events in frame_events for event in events)
+        frames = load_lazy(filepath)['info']['frames']
+    return (event.get('type', 'UNKNOWN') for frame in islice(frames, sample_frames) for event in frame.get('events', ()))
+
+def count_event_types(filepath: str, frames: Any = None, sample_frames: Optional[int] = None) -> Dict[str, int]:
+    """Count timeline events by type, optionally over the first sample_frames frames only"""
+    return Counter(iter_event_types(filepath, frames, sample_frames))
+
+def analyze_match_file(filepath: str, data: Any = None) -> str:
+    """Analyze match.json structure (data, if given, is the already-parsed file)"""
+    out = []
+    out.append(f"\n{'='*80}")
+    out.append(f"Analyzing: {filepath}")
+    out.append(f"{'='*80}\n")
+
+    if data is None:
+        data = load_lazy(filepath)
 
     # Get high-level structure
-    print("HIGH-LEVEL STRUCTURE:")
-    print(json.dumps(get_structure(data, max_depth=2, max_array_items=1), indent=2))
+    out.append("HIGH-LEVEL STRUCTURE:")
+    out.append(json.dumps(get_structure(data, max_depth=2, max_array_items=1), indent=2))
 
     # Key statistics
-    print(f"\n\nKEY STATISTICS:")
-    if isinstance(data, dict):
-        print(f"Top-level keys: {list(data.keys())}")
+    out.append(f"\n\nKEY STATISTICS:")
+    if isinstance(data, MAPPING_TYPES):
+        out.append(f"Top-level keys: {list(data.keys())}")
 
         # Check for metadata
         if 'metadata' in data:
             meta = data['metadata']
-            print(f"\nMetadata keys: {list(meta.keys()) if isinstance(meta, dict) else type(meta)}")
-            if isinstance(meta, dict) and 'participants' in meta:
-                print(f"  - Number of participants: {len(meta['participants'])}")
+            out.append(f"\nMetadata keys: {list(meta.keys()) if isinstance(meta, MAPPING_TYPES) else type(meta)}")
+            if isinstance(meta, MAPPING_TYPES) and 'participants' in meta:
+                out.append(f"  - Number of participants: {len(meta['participants'])}")
 
         # Check for info
         if 'info' in data:
             info = data['info']
-            print(f"\nInfo keys: {list(info.keys())[:20] if isinstance(info, dict) else type(info)}")
-            if isinstance(info, dict):
+            out.append(f"\nInfo keys: {list(islice(info, 20)) if isinstance(info, MAPPING_TYPES) else type(info)}")
+            if isinstance(info, MAPPING_TYPES):
                 if 'participants' in info:
-                    print(f"  - Number of participants: {len(info['participants'])}")
+                    out.append(f"  - Number of participants: {len(info['participants'])}")
                     if len(info['participants']) > 0:
-                        print(f"  - Participant keys (first player): {list(info['participants'][0].keys())}")
+                        out.append(f"  - Participant keys (first player): {list(info['participants'][0].keys())}")
                 if 'teams' in info:
-                    print(f"  - Number of teams: {len(info['teams'])}")
+                    out.append(f"  - Number of teams: {len(info['teams'])}")
+
+    return "\n".join(out) + "\n"
 
-def analyze_timeline_file(filepath: str):
-    """Analyze MatchTimeline.json structure"""
-    print(f"\n{'='*80}")
-    print(f"Analyzing: {filepath}")
-    print(f"{'='*80}\n")
+def analyze_timeline_file(filepath: str, sample_frames: Optional[int] = None, data: Any = None) -> str:
+    """Analyze MatchTimeline.json structure (data, if given, is the already-parsed file)
 
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    Pass sample_frames to build the event type distribution from only the
+    first N frames, which is usually enough to see every event type.
+    """
+    out = []
+    out.append(f"\n{'='*80}")
+    out.append(f"Analyzing: {filepath}")
+    out.append(f"{'='*80}\n")
+
+    if data is None:
+        data = load_lazy(filepath)
 
     # Get high-level structure (shallow due to size)
-    print("HIGH-LEVEL STRUCTURE:")
-    print(json.dumps(get_structure(data, max_depth=2, max_array_items=1), indent=2))
+    out.append("HIGH-LEVEL STRUCTURE:")
+    out.append(json.dumps(get_structure(data, max_depth=2, max_array_items=1), indent=2))
 
     # Key statistics
-    print(f"\n\nKEY STATISTICS:")
-    if isinstance(data, dict):
-        print(f"Top-level keys: {list(data.keys())}")
+    out.append(f"\n\nKEY STATISTICS:")
+    if isinstance(data, MAPPING_TYPES):
+        out.append(f"Top-level keys: {list(data.keys())}")
 
         if 'info' in data:
             info = data['info']
-            if isinstance(info, dict):
-                print(f"\nInfo keys: {list(info.keys())}")
+            if isinstance(info, MAPPING_TYPES):
+                out.append(f"\nInfo keys: {list(info.keys())}")
 
                 # Analyze frames
                 if 'frames' in info:
                     frames = info['frames']
-                    print(f"  - Number of frames: {len(frames)}")
+                    out.append(f"  - Number of frames: {len(frames)}")
                     if len(frames) > 0:
-                        print(f"  - Frame keys (first frame): {list(frames[0].keys())}")
+                        out.append(f"  - Frame keys (first frame): {list(frames[0].keys())}")
 
                         # Analyze events in first frame
                         if 'events' in frames[0]:
                             events = frames[0]['events']
-                            print(f"    - Events in first frame: {len(events)}")
+                            out.append(f"    - Events in first frame: {len(events)}")
                             if len(events) > 0:
-                                print(f"    - Event keys (first event): {list(events[0].keys())}")
+                                out.append(f"    - Event keys (first event): {list(events[0].keys())}")
                                 # Get unique event types
-                                event_types = {}
-                                for frame in frames:
-                                    if 'events' in frame:
-                                        for event in frame['events']:
-                                            event_type = event.get('type', 'UNKNOWN')
-                                            event_types[event_type] = event_types.get(event_type, 0) + 1
-                                print(f"\n  - Event type distribution:")
+                                event_types = count_event_types(filepath, frames, sample_frames)
+                                sampled = f" (first {sample_frames} frames)" if sample_frames is not None else ""
+                                out.append(f"\n  - Event type distribution{sampled}:")
                                 for event_type, count in sorted(event_types.items(), key=lambda x: x[1], reverse=True):
-                                    print(f"    {event_type}: {count}")
+                                    out.append(f"    {event_type}: {count}")
+
+    return "\n".join(out) + "\n"
+
+def analyze_file(filepath: str) -> str:
+    """Analyze a match or timeline file, telling them apart by content"""
+    data = load_lazy(filepath)
+    if is_timeline(data):
+        return analyze_timeline_file(filepath, data=data)
+    return analyze_match_file(filepath, data=data)
 
 if __name__ == '__main__':
-    analyze_match_file('sample_data/match.json')
-    analyze_timeline_file('sample_data/MatchTimeline.json')
+    if len(sys.argv) > 1:
+        reports = map_files(analyze_file, sys.argv[1:])
+    else:
+        reports = [analyze_match_file('sample_data/match.json'), analyze_timeline_file('sample_data/MatchTimeline.json')]
+    for report in reports:
+        sys.stdout.write(report)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Shared JSON loading for the sample data exploration scripts
+
+Faster parsers are used when installed and the stdlib json module otherwise,
+so the scripts keep running on a bare interpreter. That includes pypy3, whose
+JIT suits these dict-walking scripts when exploring many match files:
+
+    pypy3 sample_data/explore_match_data.py matches/*.json
+"""
+import json
+import mmap
+import os
+import pickle
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Prefer the yajl2 C backend for streaming; plain ijson picks the best one left
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+if ijson is not None:
+    from ijson.common import ObjectBuilder
+
+STREAMING = ijson is not None
+
+# Only the bundled sample files get sidecar caches; other inputs are parsed as-is
+SAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Where load_cached keeps those sidecars (gitignored)
+CACHE_DIR = os.path.join(SAMPLE_DIR, '.cache')
+
+# Container types a parsed document may contain (dict/list, or simdjson's lazy proxies)
+if simdjson is not None:
+    MAPPING_TYPES = (dict, simdjson.Object)
+    SEQUENCE_TYPES = (list, simdjson.Array)
+else:
+    MAPPING_TYPES = (dict,)
+    SEQUENCE_TYPES = (list,)
+
+@contextmanager
+def _mapped(filepath):
+    """Memory-map a file read-only so parsers read the pages in place"""
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+def load_json(filepath):
+    """Parse a JSON file into plain dicts and lists"""
+    if orjson is not None:
+        with _mapped(filepath) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=4)
+def load_cached(filepath):
+    """Parse a JSON file, reusing a pickle sidecar in CACHE_DIR when orjson is missing
+
+    orjson parses as fast as the sidecar loads, so with it installed this is
+    load_json with no files written. Sidecars are only kept for files in
+    SAMPLE_DIR, so nothing is written for (or unpickled on behalf of)
+    arbitrary inputs. A sidecar is used while it is newer than the JSON and
+    rewritten when stale. Results are also memoised per process, so treat
+    them as read-only.
+    """
+    if orjson is not None or os.path.dirname(os.path.abspath(filepath)) != SAMPLE_DIR:
+        return load_json(filepath)
+
+    cache_path = os.path.join(CACHE_DIR, os.path.basename(filepath) + '.pkl')
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    data = load_json(filepath)
+    # Write then rename so parallel workers never read a partial sidecar
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Read-only checkout; the cache is only an optimisation
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return data
+
+def load_lazy(filepath):
+    """Parse a JSON file, returning a lazy simdjson root when available
+
+    Keys, lengths and indexing work on the lazy root without converting the
+    whole document into Python objects. Falls back to load_cached.
+    """
+    if simdjson is not None:
+        with _mapped(filepath) as mm:
+            return simdjson.Parser().parse(mm)
+    return load_cached(filepath)
+
+def stream_items(filepath, prefix):
+    """Yield each value at an ijson prefix (e.g. 'info.frames.item') as it is parsed
+
+    Only the matched values are built; requires STREAMING.
+    """
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+def is_timeline(data):
+    """Tell a match timeline (info.frames) from a match detail document"""
+    info = data.get('info')
+    return isinstance(info, MAPPING_TYPES) and 'frames' in info
+
+def _resolve(node, parts):
+    """Yield the values at an ijson-style path (split on '.') in a parsed document"""
+    if not parts:
+        yield node
+        return
+    head, rest = parts[0], parts[1:]
+    if head == 'item':
+        if isinstance(node, list):
+            for child in node:
+                yield from _resolve(child, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _resolve(node[head], rest)
+
+def extract_paths(filepath, limits):
+    """Collect only the values at the given ijson-style paths (e.g. 'info.participants.item')
+
+    limits maps each path to the most values to keep, or None for all of them;
+    paths may be nested (a participant and its 'kills'). With orjson installed
+    (or without ijson) the paths are resolved on load_cached(), as a full orjson
+    parse beats any Python-level event loop. Otherwise a single ijson pass
+    builds just those subtrees; if every path has a limit, it stops reading as
+    soon as all of them are met.
+    """
+    found = {path: [] for path in limits}
+    if orjson is not None or not STREAMING:
+        data = load_cached(filepath)
+        for path, limit in limits.items():
+            found[path] = list(islice(_resolve(data, path.split('.')), limit))
+        return found
+
+    taken = dict.fromkeys(limits, 0)
+    unbounded = any(limit is None for limit in limits.values())
+    remaining = sum(limit for limit in limits.values() if limit is not None)
+    # [path, builder, open containers] for subtrees being built; always nested,
+    # so the innermost (last) entry is the only one an end event can close
+    active = []
+    with open(filepath, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if active:
+                for entry in active:
+                    entry[1].event(event, value)
+                    if event in ('start_map', 'start_array'):
+                        entry[2] += 1
+                    elif event in ('end_map', 'end_array'):
+                        entry[2] -= 1
+                if not active[-1][2]:
+                    path, builder, _ = active.pop()
+                    found[path].append(builder.value)
+
+            if prefix in limits and event not in ('map_key', 'end_map', 'end_array'):
+                limit = limits[prefix]
+                if limit is None or taken[prefix] < limit:
+                    taken[prefix] += 1
+                    if event in ('start_map', 'start_array'):
+                        builder = ObjectBuilder()
+                        builder.event(event, value)
+                        active.append([prefix, builder, 1])
+                    else:
+                        found[prefix].append(value)
+                    if limit is not None:
+                        remaining -= 1
+
+            if not remaining and not unbounded and not active:
+                break
+    return found
+
+def map_files(analyze, filepaths):
+    """Yield analyze(filepath) for each file in order, using worker processes for batches
+
+    Parsing is GIL-bound within a file but independent across files.
+    """
+    if len(filepaths) <= 1:
+        yield from map(analyze, filepaths)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor() as pool:
+        yield from pool.map(analyze, filepaths)